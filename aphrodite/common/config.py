@@ -891,7 +891,7 @@ class TokenizerPoolConfig:
     extra_config: dict
 
     def __post_init__(self):
-        if self.pool_type not in ("ray", ) and not isinstance(
+        if self.pool_type not in ("ray", "process") and not isinstance(
                 self.pool_type, type):
             raise ValueError(f"Unknown pool type: {self.pool_type}")
         if not isinstance(self.extra_config, dict):
@@ -690,16 +690,27 @@ class LLM:
                 # We only care about the final output
                 sp.output_kind = RequestOutputKind.FINAL_ONLY
 
-        # Add requests to the engine.
-        for i, prompt in enumerate(prompts):
-            self._add_request(
-                prompt,
-                params[i] if isinstance(params, Sequence) else params,
-                lora_request=lora_request[i] if isinstance(
-                    lora_request, Sequence) else lora_request,
-                prompt_adapter_request=prompt_adapter_request,
-                priority=priority[i] if priority else 0,
-            )
+        # Add requests to the engine, batching the tokenization of all
+        # text prompts into as few tokenizer calls as possible.
+        self.llm_engine.add_request_batch(
+            request_ids=[
+                str(next(self.request_counter)) for _ in range(num_requests)
+            ],
+            prompts=list(prompts),
+            params=[
+                params[i] if isinstance(params, Sequence) else params
+                for i in range(num_requests)
+            ],
+            lora_requests=[
+                lora_request[i]
+                if isinstance(lora_request, Sequence) else lora_request
+                for i in range(num_requests)
+            ],
+            prompt_adapter_requests=[prompt_adapter_request] * num_requests,
+            priorities=[
+                priority[i] if priority else 0 for i in range(num_requests)
+            ],
+        )
 
     def _add_request(
         self,
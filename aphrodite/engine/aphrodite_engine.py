@@ -733,6 +733,73 @@ class AphroditeEngine:
             priority=priority,
         )
 
+    def add_request_batch(
+        self,
+        request_ids: List[str],
+        prompts: List[PromptType],
+        params: List[Union[SamplingParams, PoolingParams]],
+        arrival_time: Optional[float] = None,
+        lora_requests: Optional[List[Optional[LoRARequest]]] = None,
+        prompt_adapter_requests: Optional[
+            List[Optional[PromptAdapterRequest]]] = None,
+        priorities: Optional[List[int]] = None,
+    ) -> None:
+        """Batched version of :meth:`add_request`.
+
+        All text prompts are tokenized up front through batched tokenizer
+        calls (one per LoRA adapter) before the requests are added to the
+        request pool, instead of one tokenizer call per prompt.
+        """
+        num_requests = len(prompts)
+        if lora_requests is None:
+            lora_requests = [None] * num_requests
+        if prompt_adapter_requests is None:
+            prompt_adapter_requests = [None] * num_requests
+        if priorities is None:
+            priorities = [0] * num_requests
+
+        for lora_request in lora_requests:
+            if lora_request is not None and not self.lora_config:
+                raise ValueError(f"Got lora_request {lora_request} but LoRA "
+                                 "is not enabled!")
+        for priority in priorities:
+            if priority != 0 and not self.scheduler_config.policy == "priority":
+                raise ValueError(f"Got priority {priority} but "
+                                 "Priority scheduling is not enabled.")
+        if arrival_time is None:
+            arrival_time = time.time()
+
+        preprocessed_inputs_batch = self.input_preprocessor.preprocess_many(
+            prompts,
+            request_ids=request_ids,
+            lora_requests=lora_requests,
+            prompt_adapter_requests=prompt_adapter_requests,
+        )
+
+        for (request_id, preprocessed_inputs, request_params, lora_request,
+             prompt_adapter_request,
+             priority) in zip(request_ids, preprocessed_inputs_batch, params,
+                              lora_requests, prompt_adapter_requests,
+                              priorities):
+            processed_inputs = self.input_processor(preprocessed_inputs)
+
+            # This is a bit of a hack - copy the mm_processor_kwargs that were
+            # used in the input processor to the processed output, since these
+            # kwargs are presumed to be immutable and the values should be
+            # aligned between the input processor (here) and the input mapper.
+            processed_inputs["mm_processor_kwargs"] = preprocessed_inputs.get(
+                "mm_processor_kwargs")
+
+            self._add_processed_request(
+                request_id=request_id,
+                processed_inputs=processed_inputs,
+                params=request_params,
+                arrival_time=arrival_time,
+                lora_request=lora_request,
+                prompt_adapter_request=prompt_adapter_request,
+                priority=priority,
+            )
+
     def _create_sequence_group_with_sampling(
         self,
         request_id: str,
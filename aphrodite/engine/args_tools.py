@@ -338,7 +338,8 @@ class EngineArgs:
                             default=EngineArgs.tokenizer_pool_type,
                             help="Category: Model Options\n"
                             "The type of tokenizer pool to use for "
-                            "asynchronous tokenization. Ignored if "
+                            "asynchronous tokenization (\"ray\" or "
+                            "\"process\"). Ignored if "
                             "tokenizer_pool_size is 0.")
         parser.add_argument("--tokenizer-pool-extra-config",
                             type=str,
@@ -1,32 +1,73 @@
 import asyncio
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+import types
+from collections import OrderedDict
+from typing import (TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional,
+                    Tuple, Union)
 
 from loguru import logger
-from typing_extensions import assert_never
 
 from aphrodite.common.config import ModelConfig
 from aphrodite.common.utils import print_warning_once
 from aphrodite.lora.request import LoRARequest
 from aphrodite.prompt_adapter.request import PromptAdapterRequest
+from aphrodite.transformers_utils.dyn_batch_tokenizer import (
+    AsyncDynamicBatchTokenizer)
 from aphrodite.transformers_utils.tokenizer_group import BaseTokenizerGroup
 
 from .data import (DecoderOnlyInputs, EncoderDecoderInputs, PromptType,
                    SingletonPrompt)
-from .parse import is_explicit_encoder_decoder_prompt, parse_singleton_prompt
+from .parse import is_explicit_encoder_decoder_prompt
 
 if TYPE_CHECKING:
     from aphrodite.multimodal import MultiModalDataDict
 
 
-PromptComponents = Tuple[Optional[str], List[int],
-                         Optional["MultiModalDataDict"], Optional[Dict[str,
-                                                                       Any]]]
-DecoderPromptComponents = Tuple[Optional[str], Optional[List[int]],
-                                Optional["MultiModalDataDict"],
-                                Optional[Dict[str, Any]]]
+# Shared immutable empty mapping for requests without mm_processor_kwargs,
+# so the enc/dec path does not allocate a fresh dict per request. Consumers
+# treat it as read-only; anything needing to mutate it must copy first.
+_EMPTY_MM_KWARGS: "types.MappingProxyType[str, Any]" = types.MappingProxyType(
+    {})
+
+# Prompts longer than this are not memoized: they are unlikely to repeat
+# and would crowd shorter, frequently reused prompts out of the cache.
+_TOK_CACHE_MAX_PROMPT_LEN = 2048
+
+
+class PromptComponents(NamedTuple):
+    """Components extracted from a :class:`SingletonPrompt`.
+
+    ``prompt_token_ids`` is None while the prompt carries text that has
+    not been tokenized yet. Inherits from tuple, so existing positional
+    unpacking keeps working.
+    """
+
+    prompt: Optional[str]
+    prompt_token_ids: Optional[List[int]]
+    multi_modal_data: Optional["MultiModalDataDict"] = None
+    mm_processor_kwargs: Optional[Dict[str, Any]] = None
+
+
+DecoderPromptComponents = PromptComponents
+
+
+class _TokenizerContext(NamedTuple):
+    """Per-LoRA special token ids, resolved once and cached.
+
+    Only the ids are cached: holding the tokenizer object here would
+    pin every adapter's tokenizer for the process lifetime, defeating
+    the LRU eviction in the tokenizer group.
+    """
+
+    bos_token_id: Optional[int]
+    eos_token_id: Optional[int]
 
 
 class InputPreprocessor:
+    # Slotted to avoid the per-instance __dict__ and speed up attribute
+    # reads on the per-request path.
+    __slots__ = ("model_config", "tokenizer", "_is_enc_dec",
+                 "_tok_ctx_by_lora", "_dec_start_id", "_default_dec_prompt",
+                 "_dyn_tok", "_tok_cache", "_tok_cache_cap")
 
     def __init__(
         self,
@@ -37,6 +78,28 @@ class InputPreprocessor:
 
         self.model_config = model_config
         self.tokenizer = tokenizer
+        # Resolve per-request invariants once instead of re-running the
+        # attribute chains on every preprocess call.
+        self._is_enc_dec = bool(model_config.is_encoder_decoder_model
+                                ) if model_config is not None else False
+        if tokenizer is None:
+            # Warn once here instead of on every token id lookup; the
+            # getters below just serve the cached None.
+            logger.warning("Tokenizer is not initialized, using None for "
+                           "BOS/EOS token ids")
+        self._tok_ctx_by_lora: Dict[int, _TokenizerContext] = {}
+        self._dec_start_id = (self._compute_decoder_start_token_id()
+                              if self._is_enc_dec else None)
+        self._default_dec_prompt: Optional[List[int]] = None
+        # Created lazily on the first async tokenization so that the
+        # batching task is bound to the serving event loop.
+        self._dyn_tok: Optional[AsyncDynamicBatchTokenizer] = None
+        # LRU cache of token ids for recently seen text prompts; chat
+        # serving re-sends identical system prompts and few-shot
+        # prefixes, and a hit skips the tokenizer call entirely.
+        self._tok_cache: "OrderedDict[Tuple[int, str], Tuple[int, ...]]" = (
+            OrderedDict())
+        self._tok_cache_cap = 4096
 
     def get_tokenizer_group(self) -> BaseTokenizerGroup:
         if self.tokenizer is None:
@@ -45,25 +108,36 @@ class InputPreprocessor:
 
         return self.tokenizer
 
-    def get_bos_token_id(self,
-                         lora_request: Optional[LoRARequest] = None
-                         ) -> Optional[int]:
+    def _resolve_tok(
+        self,
+        lora_request: Optional[LoRARequest] = None,
+    ) -> Optional[_TokenizerContext]:
+        """Resolve the special token ids for a LoRA request, caching
+        them per adapter. Returns None when the tokenizer is not
+        initialized."""
         if self.tokenizer is None:
-            logger.warning("Using None for BOS token id because tokenizer "
-                           "is not initialized")
             return None
 
-        return self.tokenizer.get_lora_tokenizer(lora_request).bos_token_id
+        lora_int_id = lora_request.lora_int_id if lora_request else 0
+        ctx = self._tok_ctx_by_lora.get(lora_int_id)
+        if ctx is None:
+            tokenizer = self.tokenizer.get_lora_tokenizer(lora_request)
+            ctx = _TokenizerContext(tokenizer.bos_token_id,
+                                    tokenizer.eos_token_id)
+            self._tok_ctx_by_lora[lora_int_id] = ctx
+        return ctx
 
-    def get_eos_token_id(self,
+    def get_bos_token_id(self,
                          lora_request: Optional[LoRARequest] = None
                          ) -> Optional[int]:
-        if self.tokenizer is None:
-            logger.warning("Using None for EOS token id because tokenizer "
-                           "is not initialized")
-            return None
+        ctx = self._resolve_tok(lora_request)
+        return ctx.bos_token_id if ctx is not None else None
 
-        return self.tokenizer.get_lora_tokenizer(lora_request).eos_token_id
+    def get_eos_token_id(self,
+                         lora_request: Optional[LoRARequest] = None
+                         ) -> Optional[int]:
+        ctx = self._resolve_tok(lora_request)
+        return ctx.eos_token_id if ctx is not None else None
 
     def get_decoder_start_token_id(self) -> Optional[int]:
         '''
@@ -72,10 +146,15 @@ class InputPreprocessor:
         model config is unavailable.
         '''
 
-        if not self.is_encoder_decoder_model():
-            print_warning_once("Using None for decoder start token id because "
-                               "this is not an encoder/decoder model.")
-            return None
+        # For non-encoder/decoder models this is None; the state was
+        # decided at construction, so no per-call warning is needed.
+        return self._dec_start_id
+
+    def _compute_decoder_start_token_id(self) -> Optional[int]:
+        '''
+        Resolve the decoder start token id once at construction time;
+        :meth:`get_decoder_start_token_id` serves the cached value.
+        '''
 
         if (self.model_config is None or self.model_config.hf_config is None):
             print_warning_once("Using None for decoder start token id because "
@@ -124,9 +203,13 @@ class InputPreprocessor:
         * prompt_token_ids
         '''
 
-        bos_token_id = self.get_bos_token_id()
-        assert bos_token_id is not None
-        return [bos_token_id]
+        if self._default_dec_prompt is None:
+            bos_token_id = self.get_bos_token_id()
+            assert bos_token_id is not None
+            self._default_dec_prompt = [bos_token_id]
+
+        # Return a copy; callers may mutate the result.
+        return list(self._default_dec_prompt)
 
     def _prepare_decoder_input_ids_for_generation(
         self,
@@ -153,7 +236,7 @@ class InputPreprocessor:
         * Processed token list
         """
 
-        decoder_start_token_id = self.get_decoder_start_token_id()
+        decoder_start_token_id = self._dec_start_id
         assert decoder_start_token_id is not None
 
         if decoder_input_ids is None:
@@ -161,11 +244,19 @@ class InputPreprocessor:
             # use decoder_start_token_id as decoder_input_ids
             decoder_input_ids = self._get_default_enc_dec_decoder_prompt()
 
-        if force_bos and (len(decoder_input_ids) == 0
-                          or decoder_input_ids[0] != decoder_start_token_id):
-            decoder_input_ids = [decoder_start_token_id] + decoder_input_ids
+        if not force_bos:
+            return decoder_input_ids
 
-        return decoder_input_ids
+        if decoder_input_ids and decoder_input_ids[0] == decoder_start_token_id:
+            # Common case: the prompt already starts with the decoder
+            # start token (e.g. chat templates), nothing to prepend.
+            return decoder_input_ids
+
+        # extend copies the tail in one memcpy, unlike list
+        # concatenation which touches every element.
+        prefixed = [decoder_start_token_id]
+        prefixed.extend(decoder_input_ids)
+        return prefixed
 
     def _apply_prompt_adapter(
         self,
@@ -173,12 +264,43 @@ class InputPreprocessor:
         prompt_adapter_request: Optional[PromptAdapterRequest],
     ) -> List[int]:
         if prompt_adapter_request:
-            prompt_token_ids = (
-                [0] * prompt_adapter_request.prompt_adapter_num_virtual_tokens
-                + prompt_token_ids)
+            # Build the prefixed list in one allocation instead of
+            # concatenating, which copies every token a second time.
+            num_virtual_tokens = (
+                prompt_adapter_request.prompt_adapter_num_virtual_tokens)
+            prefixed = [0] * (num_virtual_tokens + len(prompt_token_ids))
+            prefixed[num_virtual_tokens:] = prompt_token_ids
+            prompt_token_ids = prefixed
 
         return prompt_token_ids
 
+    def _tok_cache_get(
+        self,
+        prompt: str,
+        lora_request: Optional[LoRARequest],
+    ) -> Optional[List[int]]:
+        key = (lora_request.lora_int_id if lora_request else 0, prompt)
+        cached = self._tok_cache.get(key)
+        if cached is None:
+            return None
+        self._tok_cache.move_to_end(key)
+        # Return a fresh list so that callers are free to mutate it
+        # (e.g. the prompt adapter path prepends virtual tokens).
+        return list(cached)
+
+    def _tok_cache_put(
+        self,
+        prompt: str,
+        lora_request: Optional[LoRARequest],
+        prompt_token_ids: List[int],
+    ) -> None:
+        if len(prompt) > _TOK_CACHE_MAX_PROMPT_LEN:
+            return
+        key = (lora_request.lora_int_id if lora_request else 0, prompt)
+        self._tok_cache[key] = tuple(prompt_token_ids)
+        if len(self._tok_cache) > self._tok_cache_cap:
+            self._tok_cache.popitem(last=False)
+
     def _tokenize_prompt(
         self,
         prompt: str,
@@ -189,11 +311,17 @@ class InputPreprocessor:
         Apply the model's tokenizer to a text prompt, returning the
         corresponding token IDs.
         """
+        cached = self._tok_cache_get(prompt, lora_request)
+        if cached is not None:
+            return cached
+
         tokenizer = self.get_tokenizer_group()
 
-        return tokenizer.encode(request_id=request_id,
-                                prompt=prompt,
-                                lora_request=lora_request)
+        prompt_token_ids = tokenizer.encode(request_id=request_id,
+                                            prompt=prompt,
+                                            lora_request=lora_request)
+        self._tok_cache_put(prompt, lora_request, prompt_token_ids)
+        return prompt_token_ids
 
     async def _tokenize_prompt_async(
         self,
@@ -202,11 +330,78 @@ class InputPreprocessor:
         lora_request: Optional[LoRARequest],
     ) -> List[int]:
         """Async version of :meth:`_tokenize_prompt`."""
+        cached = self._tok_cache_get(prompt, lora_request)
+        if cached is not None:
+            return cached
+
         tokenizer = self.get_tokenizer_group()
 
-        return await tokenizer.encode_async(request_id=request_id,
-                                            prompt=prompt,
-                                            lora_request=lora_request)
+        if self._dyn_tok is None:
+            self._dyn_tok = AsyncDynamicBatchTokenizer(tokenizer)
+
+        prompt_token_ids = await self._dyn_tok.encode(
+            prompt, request_id=request_id, lora_request=lora_request)
+        self._tok_cache_put(prompt, lora_request, prompt_token_ids)
+        return prompt_token_ids
+
+    def _tokenize_prompts_batch(
+        self,
+        prompts: List[str],
+        request_ids: List[str],
+        lora_request: Optional[LoRARequest],
+    ) -> List[List[int]]:
+        """
+        Apply the model's tokenizer to multiple text prompts in a single
+        batched call, returning the corresponding lists of token IDs.
+        """
+        tokenizer = self.get_tokenizer_group()
+
+        return tokenizer.encode_batch(prompts=prompts,
+                                      request_ids=request_ids,
+                                      lora_request=lora_request)
+
+    async def _tokenize_prompts_batch_async(
+        self,
+        prompts: List[str],
+        request_ids: List[str],
+        lora_request: Optional[LoRARequest],
+    ) -> List[List[int]]:
+        """Async version of :meth:`_tokenize_prompts_batch`."""
+        tokenizer = self.get_tokenizer_group()
+
+        return await tokenizer.encode_batch_async(prompts=prompts,
+                                                  request_ids=request_ids,
+                                                  lora_request=lora_request)
+
+    @staticmethod
+    def _parse_prompt_components(prompt: SingletonPrompt) -> PromptComponents:
+        '''
+        Parse a singleton prompt into its components without tokenizing:
+        the prompt token ids are left as None when the prompt carries
+        text that still needs tokenization. This is the single place
+        where the prompt-structure dispatch lives; the sync and async
+        paths share it and differ only in the tokenize call they apply
+        to the text.
+        '''
+
+        # The exact type check skips the MRO walk isinstance performs on
+        # the dominant plain-str case.
+        if type(prompt) is str:  # noqa: E721
+            return PromptComponents(prompt, None)
+
+        if isinstance(prompt, dict):
+            multi_modal_data = prompt.get("multi_modal_data")
+            mm_processor_kwargs = prompt.get("mm_processor_kwargs")
+
+            if "prompt_token_ids" in prompt:
+                return PromptComponents(None, prompt["prompt_token_ids"],
+                                        multi_modal_data, mm_processor_kwargs)
+
+            if "prompt" in prompt:
+                return PromptComponents(prompt["prompt"], None,
+                                        multi_modal_data, mm_processor_kwargs)
+
+        raise TypeError("inputs must be a string, TextPrompt, or TokensPrompt")
 
     def _extract_prompt_components(
         self,
@@ -231,36 +426,20 @@ class InputPreprocessor:
         * mm_processor_kwargs (request-level input processor/mapper overrides)
         '''
 
-        parsed = parse_singleton_prompt(prompt)
-
-        if parsed["type"] == "str":
-            prompt_text = parsed["content"]
-            prompt_token_ids = self._tokenize_prompt(
-                prompt_text,
-                request_id=request_id,
-                lora_request=lora_request,
-            )
-            multi_modal_data = None
-            mm_processor_kwargs = None
-        elif parsed["type"] == "tokens":
-            prompt_text = None
-            prompt_token_ids = parsed["content"]["prompt_token_ids"]
-            multi_modal_data = parsed["content"].get("multi_modal_data")
-            mm_processor_kwargs = parsed["content"].get("mm_processor_kwargs")
-        elif parsed["type"] == "text":
-            prompt_text = parsed["content"]["prompt"]
-            prompt_token_ids = self._tokenize_prompt(
-                prompt_text,
-                request_id=request_id,
-                lora_request=lora_request,
-            )
-            multi_modal_data = parsed["content"].get("multi_modal_data")
-            mm_processor_kwargs = parsed["content"].get("mm_processor_kwargs")
-        else:
-            assert_never(parsed)
+        comps = self._parse_prompt_components(prompt)
+        if comps.prompt_token_ids is not None:
+            # Pre-tokenized: nothing to do, and (in the async twin) no
+            # coroutine to create.
+            return comps
 
-        return (prompt_text, prompt_token_ids, multi_modal_data,
-                mm_processor_kwargs)
+        prompt_token_ids = self._tokenize_prompt(
+            comps.prompt,
+            request_id=request_id,
+            lora_request=lora_request,
+        )
+        return PromptComponents(comps.prompt, prompt_token_ids,
+                                comps.multi_modal_data,
+                                comps.mm_processor_kwargs)
 
     async def _extract_prompt_components_async(
         self,
@@ -269,36 +448,18 @@ class InputPreprocessor:
         lora_request: Optional[LoRARequest] = None,
     ) -> PromptComponents:
         """Async version of :meth:`_extract_prompt_components`."""
-        parsed = parse_singleton_prompt(prompt)
-
-        if parsed["type"] == "str":
-            prompt_text = parsed["content"]
-            prompt_token_ids = await self._tokenize_prompt_async(
-                prompt_text,
-                request_id=request_id,
-                lora_request=lora_request,
-            )
-            multi_modal_data = None
-            mm_processor_kwargs = None
-        elif parsed["type"] == "tokens":
-            prompt_text = None
-            prompt_token_ids = parsed["content"]["prompt_token_ids"]
-            multi_modal_data = parsed["content"].get("multi_modal_data")
-            mm_processor_kwargs = parsed["content"].get("mm_processor_kwargs")
-        elif parsed["type"] == "text":
-            prompt_text = parsed["content"]["prompt"]
-            prompt_token_ids = await self._tokenize_prompt_async(
-                prompt_text,
-                request_id=request_id,
-                lora_request=lora_request,
-            )
-            multi_modal_data = parsed["content"].get("multi_modal_data")
-            mm_processor_kwargs = parsed["content"].get("mm_processor_kwargs")
-        else:
-            assert_never(parsed)
+        comps = self._parse_prompt_components(prompt)
+        if comps.prompt_token_ids is not None:
+            return comps
 
-        return (prompt_text, prompt_token_ids, multi_modal_data,
-                mm_processor_kwargs)
+        prompt_token_ids = await self._tokenize_prompt_async(
+            comps.prompt,
+            request_id=request_id,
+            lora_request=lora_request,
+        )
+        return PromptComponents(comps.prompt, prompt_token_ids,
+                                comps.multi_modal_data,
+                                comps.mm_processor_kwargs)
 
     def _build_enc_dec_llm_inputs(
         self,
@@ -306,8 +467,8 @@ class InputPreprocessor:
         decoder_comps: DecoderPromptComponents,
         mm_processor_kwargs: Dict[str, Any],
     ) -> EncoderDecoderInputs:
-        encoder_prompt, encoder_prompt_ids, encoder_mm_data, _ = encoder_comps
-        decoder_prompt, decoder_prompt_ids, decoder_mm_data, _ = decoder_comps
+        encoder_mm_data = encoder_comps.multi_modal_data
+        decoder_mm_data = decoder_comps.multi_modal_data
 
         if decoder_mm_data is not None:
             raise ValueError(
@@ -318,18 +479,18 @@ class InputPreprocessor:
         # <|image|><|begin_of_text|>hello world. And we should not add
         # another <|begin_of_text|> to the beginning.
         decoder_prompt_ids = (self._prepare_decoder_input_ids_for_generation(
-            decoder_prompt_ids,
+            decoder_comps.prompt_token_ids,
             force_bos=(encoder_mm_data is None and decoder_mm_data is None)))
 
         return EncoderDecoderInputs(
             prompt_token_ids=decoder_prompt_ids,
-            prompt=decoder_prompt,
+            prompt=decoder_comps.prompt,
             multi_modal_data=decoder_mm_data,
             mm_processor_kwargs=mm_processor_kwargs,
-            encoder_prompt_token_ids=encoder_prompt_ids,
-            encoder_prompt=encoder_prompt,
+            encoder_prompt_token_ids=encoder_comps.prompt_token_ids,
+            encoder_prompt=encoder_comps.prompt,
             encoder_multi_modal_data=encoder_mm_data,
-)
+        )
 
     def _process_encoder_decoder_prompt(
         self,
@@ -379,14 +540,15 @@ class InputPreprocessor:
             )
 
             if (decoder_input := prompt["decoder_prompt"]) is None:
-                decoder_comps = None, None, None, None
+                decoder_comps = PromptComponents(None, None)
             else:
                 decoder_comps = self._extract_prompt_components(
                     decoder_input,
                     request_id=request_id,
                 )
             # Handle this carefully in case it was directly initialized by user
-            mm_processor_kwargs = prompt.get("mm_processor_kwargs", {})
+            mm_processor_kwargs = prompt.get("mm_processor_kwargs",
+                                             _EMPTY_MM_KWARGS)
         else:
             encoder_comps = self._extract_prompt_components(
                 prompt,
@@ -394,9 +556,10 @@ class InputPreprocessor:
             )
             # If there are no decoder components, we assume the
             # mm_processor_kwargs are in the encoder prompt
-            mm_processor_kwargs = encoder_comps[-1] if encoder_comps[
-                -1] is not None else {}
-            decoder_comps = None, None, None, None
+            mm_processor_kwargs = (encoder_comps.mm_processor_kwargs
+                                   if encoder_comps.mm_processor_kwargs
+                                   is not None else _EMPTY_MM_KWARGS)
+            decoder_comps = PromptComponents(None, None)
 
         return self._build_enc_dec_llm_inputs(
             encoder_comps,
@@ -414,23 +577,30 @@ class InputPreprocessor:
         decoder_comps: DecoderPromptComponents
 
         if is_explicit_encoder_decoder_prompt(prompt):
-            encoder_task = self._extract_prompt_components_async(
-                prompt["encoder_prompt"],
-                request_id=request_id,
-            )
+            # Schedule the encoder tokenization eagerly so that it can
+            # overlap with the decoder tokenization below (and both can
+            # land in the same dynamic tokenizer batch).
+            encoder_fut = asyncio.ensure_future(
+                self._extract_prompt_components_async(
+                    prompt["encoder_prompt"],
+                    request_id=request_id,
+                ))
 
             if (decoder_input := prompt["decoder_prompt"]) is None:
-                encoder_comps = await encoder_task
-                decoder_comps = None, None, None, None
+                encoder_comps = await encoder_fut
+                decoder_comps = PromptComponents(None, None)
             else:
-                decoder_task = self._extract_prompt_components_async(
-                    decoder_input,
-                    request_id=request_id,
-                )
+                decoder_fut = asyncio.ensure_future(
+                    self._extract_prompt_components_async(
+                        decoder_input,
+                        request_id=request_id,
+                    ))
 
                 encoder_comps, decoder_comps = await asyncio.gather(
-                    encoder_task, decoder_task)
-                mm_processor_kwargs = prompt["mm_processor_kwargs"]
+                    encoder_fut, decoder_fut)
+            # Handle this carefully in case it was directly initialized by user
+            mm_processor_kwargs = prompt.get("mm_processor_kwargs",
+                                             _EMPTY_MM_KWARGS)
         else:
             encoder_comps = await self._extract_prompt_components_async(
                 prompt,
@@ -439,9 +609,10 @@ class InputPreprocessor:
 
             # If there are no decoder components, we assume the
             # mm_processor_kwargs are in the encoder prompt
-            mm_processor_kwargs = encoder_comps[-1] if encoder_comps[
-                -1] is not None else {}
-            decoder_comps = None, None, None, None
+            mm_processor_kwargs = (encoder_comps.mm_processor_kwargs
+                                   if encoder_comps.mm_processor_kwargs
+                                   is not None else _EMPTY_MM_KWARGS)
+            decoder_comps = PromptComponents(None, None)
 
         return self._build_enc_dec_llm_inputs(
             encoder_comps,
@@ -454,16 +625,15 @@ class InputPreprocessor:
         prompt_comps: PromptComponents,
         prompt_adapter_request: Optional[PromptAdapterRequest],
     ) -> DecoderOnlyInputs:
-        (prompt, prompt_token_ids, multi_modal_data,
-         mm_processor_kwargs) = prompt_comps
-
         prompt_token_ids = self._apply_prompt_adapter(
-            prompt_token_ids, prompt_adapter_request=prompt_adapter_request)
+            prompt_comps.prompt_token_ids,
+            prompt_adapter_request=prompt_adapter_request)
 
-        return DecoderOnlyInputs(prompt_token_ids=prompt_token_ids,
-                                 prompt=prompt,
-                                 multi_modal_data=multi_modal_data,
-                                 mm_processor_kwargs=mm_processor_kwargs)
+        return DecoderOnlyInputs(
+            prompt_token_ids=prompt_token_ids,
+            prompt=prompt_comps.prompt,
+            multi_modal_data=prompt_comps.multi_modal_data,
+            mm_processor_kwargs=prompt_comps.mm_processor_kwargs)
 
     def _process_decoder_only_prompt(
         self,
@@ -488,16 +658,25 @@ class InputPreprocessor:
         * :class:`DecoderOnlyInputs` instance
         '''
 
-        prompt_comps = self._extract_prompt_components(
-            prompt,
-            request_id=request_id,
-            lora_request=lora_request,
-        )
+        # The parse and the build are fused here so the hot decoder-only
+        # path goes through a single frame.
+        (prompt_text, prompt_token_ids, multi_modal_data,
+         mm_processor_kwargs) = self._parse_prompt_components(prompt)
 
-        return self._build_decoder_only_llm_inputs(
-            prompt_comps,
-            prompt_adapter_request=prompt_adapter_request,
-        )
+        if prompt_token_ids is None:
+            prompt_token_ids = self._tokenize_prompt(
+                prompt_text,
+                request_id=request_id,
+                lora_request=lora_request,
+            )
+
+        prompt_token_ids = self._apply_prompt_adapter(
+            prompt_token_ids, prompt_adapter_request=prompt_adapter_request)
+
+        return DecoderOnlyInputs(prompt_token_ids=prompt_token_ids,
+                                 prompt=prompt_text,
+                                 multi_modal_data=multi_modal_data,
+                                 mm_processor_kwargs=mm_processor_kwargs)
 
     async def _process_decoder_only_prompt_async(
         self,
@@ -507,16 +686,23 @@ class InputPreprocessor:
         prompt_adapter_request: Optional[PromptAdapterRequest] = None,
     ) -> DecoderOnlyInputs:
         """Async version of :meth:`_process_decoder_only_prompt`."""
-        prompt_comps = await self._extract_prompt_components_async(
-            prompt,
-            request_id=request_id,
-            lora_request=lora_request,
-        )
+        (prompt_text, prompt_token_ids, multi_modal_data,
+         mm_processor_kwargs) = self._parse_prompt_components(prompt)
 
-        return self._build_decoder_only_llm_inputs(
-            prompt_comps,
-            prompt_adapter_request=prompt_adapter_request,
-        )
+        if prompt_token_ids is None:
+            prompt_token_ids = await self._tokenize_prompt_async(
+                prompt_text,
+                request_id=request_id,
+                lora_request=lora_request,
+            )
+
+        prompt_token_ids = self._apply_prompt_adapter(
+            prompt_token_ids, prompt_adapter_request=prompt_adapter_request)
+
+        return DecoderOnlyInputs(prompt_token_ids=prompt_token_ids,
+                                 prompt=prompt_text,
+                                 multi_modal_data=multi_modal_data,
+                                 mm_processor_kwargs=mm_processor_kwargs)
 
     def preprocess(
         self,
@@ -574,5 +760,174 @@ class InputPreprocessor:
             prompt_adapter_request=prompt_adapter_request,
         )
 
+    def _partition_prompts_for_batch(
+        self,
+        prompts: List[SingletonPrompt],
+    ) -> Tuple[List[Optional[PromptComponents]], List[int], List[str]]:
+        '''
+        Partition a list of singleton prompts into components which are
+        already complete (pre-tokenized prompts) and text prompts still
+        awaiting tokenization.
+
+        Returns:
+
+        * components: per-prompt :class:`PromptComponents`, with the
+          token ids of text prompts left as None placeholders
+        * pending_idxs: indices into `components` awaiting token ids
+        * pending_texts: the corresponding prompt texts
+        '''
+        components: List[Optional[PromptComponents]] = []
+        pending_idxs: List[int] = []
+        pending_texts: List[str] = []
+
+        for idx, prompt in enumerate(prompts):
+            comps = self._parse_prompt_components(prompt)
+            components.append(comps)
+            if comps.prompt_token_ids is None:
+                pending_idxs.append(idx)
+                pending_texts.append(comps.prompt)
+
+        return components, pending_idxs, pending_texts
+
+    def preprocess_batch(
+        self,
+        prompts: List[PromptType],
+        request_ids: List[str],
+        lora_request: Optional[LoRARequest] = None,
+        prompt_adapter_request: Optional[PromptAdapterRequest] = None,
+    ) -> List[Union[DecoderOnlyInputs, EncoderDecoderInputs]]:
+        """Preprocess multiple input prompts, batching the tokenization
+        of any text prompts into a single tokenizer call."""
+        if len(prompts) == 1:
+            # Short-circuit the common single-prompt case.
+            return [
+                self.preprocess(prompts[0],
+                                request_id=request_ids[0],
+                                lora_request=lora_request,
+                                prompt_adapter_request=prompt_adapter_request)
+            ]
+
+        return self.preprocess_many(
+            prompts,
+            request_ids=request_ids,
+            lora_requests=[lora_request] * len(prompts),
+            prompt_adapter_requests=[prompt_adapter_request] * len(prompts),
+        )
+
+    def preprocess_many(
+        self,
+        prompts: List[PromptType],
+        request_ids: List[str],
+        lora_requests: Optional[List[Optional[LoRARequest]]] = None,
+        prompt_adapter_requests: Optional[
+            List[Optional[PromptAdapterRequest]]] = None,
+    ) -> List[Union[DecoderOnlyInputs, EncoderDecoderInputs]]:
+        """Preprocess multiple prompts with per-request LoRA and prompt
+        adapter requests.
+
+        Text prompts resolving to the same LoRA tokenizer are tokenized
+        together in one batched call; pre-tokenized and multi-modal
+        prompts skip tokenization entirely.
+        """
+        if lora_requests is None:
+            lora_requests = [None] * len(prompts)
+        if prompt_adapter_requests is None:
+            prompt_adapter_requests = [None] * len(prompts)
+
+        if self.is_encoder_decoder_model():
+            # Encoder-decoder prompts carry sub-prompts; process them
+            # one at a time.
+            return [
+                self._process_encoder_decoder_prompt(prompt,
+                                                     request_id=request_id)
+                for prompt, request_id in zip(prompts, request_ids)
+            ]
+
+        for prompt in prompts:
+            if is_explicit_encoder_decoder_prompt(prompt):
+                raise ValueError("Cannot pass encoder-decoder prompt "
+                                 "to decoder-only models")
+
+        components, pending_idxs, pending_texts = (
+            self._partition_prompts_for_batch(prompts))
+
+        if pending_texts:
+            # Prompts resolving to different LoRA tokenizers cannot share
+            # a batched call; bucket them by adapter.
+            buckets: Dict[int, List[int]] = {}
+            for pos, idx in enumerate(pending_idxs):
+                lora_request = lora_requests[idx]
+                lora_int_id = lora_request.lora_int_id if lora_request else 0
+                buckets.setdefault(lora_int_id, []).append(pos)
+
+            for positions in buckets.values():
+                idxs = [pending_idxs[pos] for pos in positions]
+                token_ids_batch = self._tokenize_prompts_batch(
+                    [pending_texts[pos] for pos in positions],
+                    request_ids=[request_ids[idx] for idx in idxs],
+                    lora_request=lora_requests[idxs[0]],
+                )
+                for idx, token_ids in zip(idxs, token_ids_batch):
+                    components[idx] = components[idx]._replace(
+                        prompt_token_ids=token_ids)
+
+        return [
+            self._build_decoder_only_llm_inputs(
+                prompt_comps,
+                prompt_adapter_request=prompt_adapter_requests[idx])
+            for idx, prompt_comps in enumerate(components)
+        ]
+
+    async def preprocess_batch_async(
+        self,
+        prompts: List[PromptType],
+        request_ids: List[str],
+        lora_request: Optional[LoRARequest] = None,
+        prompt_adapter_request: Optional[PromptAdapterRequest] = None,
+    ) -> List[Union[DecoderOnlyInputs, EncoderDecoderInputs]]:
+        """Async version of :meth:`preprocess_batch`."""
+        if len(prompts) == 1:
+            # Short-circuit the common single-prompt case.
+            return [
+                await self.preprocess_async(
+                    prompts[0],
+                    request_id=request_ids[0],
+                    lora_request=lora_request,
+                    prompt_adapter_request=prompt_adapter_request)
+            ]
+
+        if self.is_encoder_decoder_model():
+            # Encoder-decoder prompts carry sub-prompts; process them
+            # one at a time.
+            return [
+                await self._process_encoder_decoder_prompt_async(
+                    prompt, request_id=request_id)
+                for prompt, request_id in zip(prompts, request_ids)
+            ]
+
+        for prompt in prompts:
+            if is_explicit_encoder_decoder_prompt(prompt):
+                raise ValueError("Cannot pass encoder-decoder prompt "
+                                 "to decoder-only models")
+
+        components, pending_idxs, pending_texts = (
+            self._partition_prompts_for_batch(prompts))
+
+        if pending_texts:
+            token_ids_batch = await self._tokenize_prompts_batch_async(
+                pending_texts,
+                request_ids=[request_ids[idx] for idx in pending_idxs],
+                lora_request=lora_request,
+            )
+            for idx, token_ids in zip(pending_idxs, token_ids_batch):
+                components[idx] = components[idx]._replace(
+                    prompt_token_ids=token_ids)
+
+        return [
+            self._build_decoder_only_llm_inputs(
+                prompt_comps, prompt_adapter_request=prompt_adapter_request)
+            for prompt_comps in components
+        ]
+
     def is_encoder_decoder_model(self):
-        return self.model_config.is_encoder_decoder_model
+        return self._is_enc_dec
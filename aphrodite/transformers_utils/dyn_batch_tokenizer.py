@@ -0,0 +1,161 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from aphrodite.lora.request import LoRARequest
+from aphrodite.transformers_utils.tokenizer_group import BaseTokenizerGroup
+
+_QueueItem = Tuple[str, Optional[str], Optional[LoRARequest],
+                   "asyncio.Future[List[int]]"]
+
+
+class AsyncDynamicBatchTokenizer:
+    """Dynamically batches concurrent async tokenization requests.
+
+    Each request enqueues a future; a single background task drains the
+    queue up to `max_batch_size` entries (waiting at most
+    `batch_wait_timeout_s` for stragglers), issues one batched
+    `encode_batch_async` call per LoRA tokenizer, and fans the results
+    back out to the futures. This turns N independent encodes that each
+    pay FFI and GIL overhead into one batched call.
+
+    When no other encode is in flight, requests are encoded directly so
+    that lightly loaded servers keep single-call latency.
+    """
+
+    def __init__(self,
+                 tokenizer_group: BaseTokenizerGroup,
+                 max_batch_size: int = 32,
+                 batch_wait_timeout_s: float = 0.002) -> None:
+        self._tokenizer_group = tokenizer_group
+        self._max_batch_size = max_batch_size
+        self._batch_wait_timeout_s = batch_wait_timeout_s
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional["asyncio.Queue[_QueueItem]"] = None
+        self._batch_task: Optional["asyncio.Task[None]"] = None
+        self._processing_batch = False
+        self._num_direct_inflight = 0
+
+    def _ensure_batch_task(self) -> None:
+        loop = asyncio.get_event_loop()
+        if self._loop is not loop:
+            # First use, or the preprocessor moved to a new event loop
+            # (e.g. across tests): drop any state tied to the old loop
+            # and (re)create the queue and worker on the current one.
+            self.close()
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._batch_task = loop.create_task(self._batch_loop())
+
+    async def encode(self,
+                     prompt: str,
+                     request_id: Optional[str] = None,
+                     lora_request: Optional[LoRARequest] = None) -> List[int]:
+        """Encode a prompt, batching it with other in-flight requests."""
+        self._ensure_batch_task()
+        assert self._queue is not None and self._loop is not None
+
+        if (self._num_direct_inflight == 0 and self._queue.empty()
+                and not self._processing_batch):
+            # Fast path: no other encode in flight, so there is nothing to
+            # batch with; avoid the queue round-trip. Requests arriving
+            # while this one is awaited go through the queue and batch
+            # with each other.
+            self._num_direct_inflight += 1
+            try:
+                return await self._tokenizer_group.encode_async(
+                    prompt, request_id=request_id, lora_request=lora_request)
+            finally:
+                self._num_direct_inflight -= 1
+
+        future: "asyncio.Future[List[int]]" = self._loop.create_future()
+        self._queue.put_nowait((prompt, request_id, lora_request, future))
+        return await future
+
+    async def _batch_loop(self) -> None:
+        assert self._queue is not None
+
+        while True:
+            batch = [await self._queue.get()]
+            self._processing_batch = True
+            try:
+                while len(batch) < self._max_batch_size:
+                    try:
+                        batch.append(await asyncio.wait_for(
+                            self._queue.get(), self._batch_wait_timeout_s))
+                    except asyncio.TimeoutError:
+                        break
+
+                # Prompts resolving to different LoRA tokenizers cannot
+                # share a batched call.
+                groups: Dict[int, List[_QueueItem]] = {}
+                for item in batch:
+                    lora_request = item[2]
+                    lora_int_id = (lora_request.lora_int_id
+                                   if lora_request else 0)
+                    groups.setdefault(lora_int_id, []).append(item)
+
+                for items in groups.values():
+                    await self._encode_group(items)
+            finally:
+                self._processing_batch = False
+
+    async def _encode_group(self, items: List[_QueueItem]) -> None:
+        prompts = [item[0] for item in items]
+        request_ids = [item[1] for item in items]
+        lora_request = items[0][2]
+        try:
+            results = await self._tokenizer_group.encode_batch_async(
+                prompts, request_ids=request_ids, lora_request=lora_request)
+        except Exception:
+            # A batched failure (e.g. one prompt exceeding the max input
+            # length) must not fail the whole group: re-encode each prompt
+            # individually so the error lands only on the offending one.
+            for prompt, request_id, _, future in items:
+                if future.done():
+                    continue
+                try:
+                    result = await self._tokenizer_group.encode_async(
+                        prompt,
+                        request_id=request_id,
+                        lora_request=lora_request)
+                except Exception as e:
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+        else:
+            for (_, _, _, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def close(self) -> None:
+        """Cancel the background task and any queued requests."""
+        # If the owning loop is already closed (e.g. the preprocessor
+        # outlived a per-test event loop), cancelling would schedule
+        # callbacks on the dead loop and raise "Event loop is closed";
+        # the task and queued futures died with the loop, so just drop
+        # the references.
+        loop_alive = self._loop is not None and not self._loop.is_closed()
+        if self._batch_task is not None:
+            if loop_alive:
+                self._batch_task.cancel()
+            else:
+                # Finalize the coroutine eagerly instead of leaving it to
+                # the GC; unwinding its awaits touches the dead loop, so
+                # swallow the resulting error. The task object itself can
+                # never resume, so silence the "destroyed but pending"
+                # log it would emit on collection.
+                try:
+                    self._batch_task.get_coro().close()
+                except RuntimeError:
+                    pass
+                self._batch_task._log_destroy_pending = False
+            self._batch_task = None
+        if self._queue is not None:
+            if loop_alive:
+                while not self._queue.empty():
+                    *_, future = self._queue.get_nowait()
+                    if not future.done():
+                        future.cancel()
+            self._queue = None
+        self._loop = None
+        self._processing_batch = False
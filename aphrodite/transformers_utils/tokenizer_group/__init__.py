@@ -5,6 +5,7 @@ from aphrodite.common.config import (ModelConfig, ParallelConfig,
 from aphrodite.executor.ray_utils import ray
 
 from .base_tokenizer_group import AnyTokenizer, BaseTokenizerGroup
+from .multiproc_tokenizer_group import MultiProcTokenizerGroup
 from .tokenizer_group import TokenizerGroup
 
 if ray:
@@ -44,10 +45,15 @@ def get_tokenizer_group(tokenizer_pool_config: Optional[TokenizerPoolConfig],
                 "RayTokenizerGroupPool is not available. Please install "
                 "the ray package to use the Ray tokenizer group pool.")
         tokenizer_cls = RayTokenizerGroupPool
+    elif tokenizer_pool_config.pool_type == "process":
+        tokenizer_cls = MultiProcTokenizerGroup
     else:
         raise ValueError(
             f"Unknown pool type: {tokenizer_pool_config.pool_type}")
     return tokenizer_cls.from_config(tokenizer_pool_config, **init_kwargs)
 
 
-__all__ = ["AnyTokenizer", "get_tokenizer_group", "BaseTokenizerGroup"]
+__all__ = [
+    "AnyTokenizer", "get_tokenizer_group", "BaseTokenizerGroup",
+    "MultiProcTokenizerGroup", "TokenizerGroup"
+]
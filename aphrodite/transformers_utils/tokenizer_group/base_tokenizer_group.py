@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import List, Optional, Union
 
@@ -47,6 +48,47 @@ class BaseTokenizerGroup(ABC):
         """Encode a prompt using the tokenizer group."""
         pass
 
+    def encode_batch(
+            self,
+            prompts: List[str],
+            request_ids: Optional[List[str]] = None,
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        """Encode multiple prompts sharing a LoRA request.
+
+        Subclasses should override this with a single batched call to the
+        underlying tokenizer where possible; the default implementation
+        falls back to encoding the prompts one by one.
+        """
+        if request_ids is None:
+            request_ids = [None] * len(prompts)
+        return [
+            self.encode(prompt,
+                        request_id=request_id,
+                        lora_request=lora_request)
+            for prompt, request_id in zip(prompts, request_ids)
+        ]
+
+    async def encode_batch_async(
+            self,
+            prompts: List[str],
+            request_ids: Optional[List[str]] = None,
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        """Async version of :meth:`encode_batch`.
+
+        The default delegates to :meth:`encode_async` per prompt rather
+        than to the sync batch path, so that groups whose encodes await
+        remote work (e.g. the Ray pool) neither block the event loop nor
+        contend for workers held by concurrent requests.
+        """
+        if request_ids is None:
+            request_ids = [None] * len(prompts)
+        return await asyncio.gather(*[
+            self.encode_async(prompt,
+                              request_id=request_id,
+                              lora_request=lora_request)
+            for prompt, request_id in zip(prompts, request_ids)
+        ])
+
     @abstractmethod
     def get_lora_tokenizer(
         self,
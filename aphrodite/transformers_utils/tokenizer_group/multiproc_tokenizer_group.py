@@ -0,0 +1,184 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional
+
+from aphrodite.common.config import TokenizerPoolConfig
+from aphrodite.executor.multiproc_worker_utils import get_mp_context
+from aphrodite.lora.request import LoRARequest
+from aphrodite.transformers_utils.tokenizer import get_tokenizer
+from aphrodite.transformers_utils.tokenizer_group.base_tokenizer_group import (
+    AnyTokenizer, BaseTokenizerGroup)
+from aphrodite.transformers_utils.tokenizer_group.tokenizer_group import (
+    TokenizerGroup)
+from aphrodite.transformers_utils.tokenizers import MistralTokenizer
+
+# Module-global tokenizer instantiated once per worker process by
+# _init_worker, so encode calls only ship the prompt over IPC.
+_WORKER_TOKENIZER: Optional[AnyTokenizer] = None
+
+
+def _init_worker(tokenizer_id: str, tokenizer_config: dict) -> None:
+    global _WORKER_TOKENIZER
+    _WORKER_TOKENIZER = get_tokenizer(tokenizer_id, **tokenizer_config)
+
+
+def _worker_encode(prompt: str) -> List[int]:
+    assert _WORKER_TOKENIZER is not None
+    return _WORKER_TOKENIZER.encode(prompt)
+
+
+def _worker_encode_batch(prompts: List[str]) -> List[List[int]]:
+    assert _WORKER_TOKENIZER is not None
+    if isinstance(_WORKER_TOKENIZER, MistralTokenizer):
+        # MistralTokenizer only accepts a single string per call and
+        # does not understand the HF batching kwargs.
+        return [_WORKER_TOKENIZER.encode(prompt) for prompt in prompts]
+    return _WORKER_TOKENIZER(prompts, padding=False,
+                             return_attention_mask=False)["input_ids"]
+
+
+class MultiProcTokenizerGroup(BaseTokenizerGroup):
+    """A pool of tokenizer worker processes.
+
+    Each worker holds its own tokenizer instance, so concurrent encode
+    calls run in parallel across processes instead of serializing on a
+    single tokenizer. The ~50 us of IPC per call is amortized by encode
+    times in the milliseconds for long prompts.
+
+    LoRA-specific encode calls fall back to the local tokenizer group,
+    since the workers only hold the base model tokenizer.
+    """
+
+    def __init__(self, tokenizer_id: str, enable_lora: bool, max_num_seqs: int,
+                 max_input_length: Optional[int], num_workers: int,
+                 **tokenizer_config):
+        # Local group for LoRA tokenizers, input length checks, and
+        # direct tokenizer access.
+        self._local_tokenizer_group = TokenizerGroup(
+            tokenizer_id=tokenizer_id,
+            enable_lora=enable_lora,
+            max_num_seqs=max_num_seqs,
+            max_input_length=max_input_length,
+            **tokenizer_config,
+        )
+        self._num_workers = num_workers
+        self._pool = ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=get_mp_context(),
+            initializer=_init_worker,
+            initargs=(tokenizer_id, tokenizer_config),
+        )
+
+    @classmethod
+    def from_config(cls, tokenizer_pool_config: Optional[TokenizerPoolConfig],
+                    **init_kwargs) -> "MultiProcTokenizerGroup":
+        if not tokenizer_pool_config:
+            raise ValueError("tokenizer_pool_config must not be None.")
+        init_kwargs["num_workers"] = tokenizer_pool_config.pool_size
+        return cls(**init_kwargs)
+
+    def ping(self) -> bool:
+        """Check if the tokenizer group is alive."""
+        return True
+
+    def get_max_input_len(self,
+                          lora_request: Optional[LoRARequest] = None
+                          ) -> Optional[int]:
+        """Get the maximum input length for the LoRA request."""
+        return self._local_tokenizer_group.get_max_input_len(lora_request)
+
+    def encode(self,
+               prompt: str,
+               request_id: Optional[str] = None,
+               lora_request: Optional[LoRARequest] = None) -> List[int]:
+        if lora_request:
+            return self._local_tokenizer_group.encode(
+                prompt, request_id=request_id, lora_request=lora_request)
+
+        ret = self._pool.submit(_worker_encode, prompt).result()
+        self._local_tokenizer_group._raise_if_input_too_long(ret)
+        return ret
+
+    async def encode_async(
+            self,
+            prompt: str,
+            request_id: Optional[str] = None,
+            lora_request: Optional[LoRARequest] = None) -> List[int]:
+        if lora_request:
+            return await self._local_tokenizer_group.encode_async(
+                prompt, request_id=request_id, lora_request=lora_request)
+
+        loop = asyncio.get_event_loop()
+        ret = await loop.run_in_executor(self._pool, _worker_encode, prompt)
+        self._local_tokenizer_group._raise_if_input_too_long(ret)
+        return ret
+
+    def encode_batch(
+            self,
+            prompts: List[str],
+            request_ids: Optional[List[str]] = None,
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        if lora_request:
+            return self._local_tokenizer_group.encode_batch(
+                prompts, request_ids=request_ids, lora_request=lora_request)
+
+        futures = [
+            self._pool.submit(_worker_encode_batch, chunk)
+            for chunk in self._chunk_prompts(prompts)
+        ]
+        ret = [encoded for future in futures for encoded in future.result()]
+        for encoded in ret:
+            self._local_tokenizer_group._raise_if_input_too_long(encoded)
+        return ret
+
+    async def encode_batch_async(
+            self,
+            prompts: List[str],
+            request_ids: Optional[List[str]] = None,
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        if lora_request:
+            return await self._local_tokenizer_group.encode_batch_async(
+                prompts, request_ids=request_ids, lora_request=lora_request)
+
+        loop = asyncio.get_event_loop()
+        chunk_results = await asyncio.gather(*[
+            loop.run_in_executor(self._pool, _worker_encode_batch, chunk)
+            for chunk in self._chunk_prompts(prompts)
+        ])
+        ret = [encoded for chunk in chunk_results for encoded in chunk]
+        for encoded in ret:
+            self._local_tokenizer_group._raise_if_input_too_long(encoded)
+        return ret
+
+    def _chunk_prompts(self, prompts: List[str]) -> List[List[str]]:
+        """Shard a prompt list across the worker processes."""
+        if not prompts:
+            return []
+        chunk_size = -(-len(prompts) // self._num_workers)
+        return [
+            prompts[i:i + chunk_size]
+            for i in range(0, len(prompts), chunk_size)
+        ]
+
+    def shutdown(self) -> None:
+        """Shut down the worker processes."""
+        # getattr in case __init__ failed before the pool was created.
+        pool = getattr(self, "_pool", None)
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def __del__(self):
+        self.shutdown()
+
+    def get_lora_tokenizer(
+        self,
+        lora_request: Optional[LoRARequest] = None,
+    ) -> AnyTokenizer:
+        return self._local_tokenizer_group.get_lora_tokenizer(lora_request)
+
+    async def get_lora_tokenizer_async(
+        self,
+        lora_request: Optional[LoRARequest] = None,
+    ) -> AnyTokenizer:
+        return await self._local_tokenizer_group.get_lora_tokenizer_async(
+            lora_request)
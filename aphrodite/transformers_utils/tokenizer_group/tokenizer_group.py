@@ -1,3 +1,5 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
 from aphrodite.common.config import TokenizerPoolConfig
@@ -6,6 +8,7 @@ from aphrodite.lora.request import LoRARequest
 from aphrodite.transformers_utils.tokenizer import (get_lora_tokenizer,
                                                     get_lora_tokenizer_async,
                                                     get_tokenizer)
+from aphrodite.transformers_utils.tokenizers import MistralTokenizer
 
 from .base_tokenizer_group import AnyTokenizer, BaseTokenizerGroup
 
@@ -13,8 +16,9 @@ from .base_tokenizer_group import AnyTokenizer, BaseTokenizerGroup
 class TokenizerGroup(BaseTokenizerGroup):
     """A group of tokenizers that can be used for LoRA adapters."""
 
-    def __init__(self, tokenizer_id: str, enable_lora: bool, max_num_seqs: int,
-                 max_input_length: Optional[int], **tokenizer_config):
+    def __init__(self, tokenizer_id: str, enable_lora: bool,
+                 max_num_seqs: int, max_input_length: Optional[int],
+                 **tokenizer_config):
         self.tokenizer_id = tokenizer_id
         self.tokenizer_config = tokenizer_config
         self.enable_lora = enable_lora
@@ -22,6 +26,22 @@ class TokenizerGroup(BaseTokenizerGroup):
         self.tokenizer = get_tokenizer(self.tokenizer_id, **tokenizer_config)
         self.lora_tokenizers = LRUCache[AnyTokenizer](
             capacity=max_num_seqs if enable_lora else 0)
+        # Created lazily so that sync-only users (and per-actor groups in
+        # the Ray pool) do not spawn an idle thread.
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            # A single worker keeps encodes off the event loop without
+            # sharing the tokenizer across threads: fast tokenizers hold
+            # a mutable Rust borrow during encode and raise "Already
+            # borrowed" when used concurrently (e.g. while the OpenAI
+            # serving layer toggles truncation on the same instance).
+            # Cross-request parallelism comes from batched encode calls
+            # and the process pool, not from threads.
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="tokenizer")
+        return self._executor
 
     @classmethod
     def from_config(cls, tokenizer_pool_config: Optional[TokenizerPoolConfig],
@@ -65,10 +85,47 @@ class TokenizerGroup(BaseTokenizerGroup):
             request_id: Optional[str] = None,
             lora_request: Optional[LoRARequest] = None) -> List[int]:
         tokenizer = await self.get_lora_tokenizer_async(lora_request)
-        ret = tokenizer.encode(prompt)
+        loop = asyncio.get_event_loop()
+        ret = await loop.run_in_executor(self._get_executor(),
+                                         tokenizer.encode, prompt)
         self._raise_if_input_too_long(ret, lora_request)
         return ret
 
+    def _encode_batch(self, tokenizer: AnyTokenizer, prompts: List[str],
+                      lora_request: Optional[LoRARequest]) -> List[List[int]]:
+        if isinstance(tokenizer, MistralTokenizer):
+            # MistralTokenizer only accepts a single string per call and
+            # does not understand the HF batching kwargs.
+            ret = [tokenizer.encode(prompt) for prompt in prompts]
+        else:
+            # A single batched call lets fast (Rust-backed) tokenizers
+            # release the GIL and tokenize the prompts in parallel, instead
+            # of paying one FFI round-trip per prompt.
+            ret = tokenizer(prompts, padding=False,
+                            return_attention_mask=False)["input_ids"]
+        for encoded in ret:
+            self._raise_if_input_too_long(encoded, lora_request)
+        return ret
+
+    def encode_batch(
+            self,
+            prompts: List[str],
+            request_ids: Optional[List[str]] = None,
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        tokenizer = self.get_lora_tokenizer(lora_request)
+        return self._encode_batch(tokenizer, prompts, lora_request)
+
+    async def encode_batch_async(
+            self,
+            prompts: List[str],
+            request_ids: Optional[List[str]] = None,
+            lora_request: Optional[LoRARequest] = None) -> List[List[int]]:
+        tokenizer = await self.get_lora_tokenizer_async(lora_request)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._get_executor(),
+                                          self._encode_batch, tokenizer,
+                                          prompts, lora_request)
+
     def get_lora_tokenizer(
         self,
         lora_request: Optional[LoRARequest] = None,
@@ -823,6 +823,10 @@ def get_tokenizer_pool_config(tokenizer_group_type):
         return TokenizerPoolConfig(pool_size=1,
                                    pool_type="ray",
                                    extra_config={})
+    if tokenizer_group_type == "process":
+        return TokenizerPoolConfig(pool_size=1,
+                                   pool_type="process",
+                                   extra_config={})
     if isinstance(tokenizer_group_type, type):
         return TokenizerPoolConfig(pool_size=1,
                                    pool_type=tokenizer_group_type,
@@ -1,9 +1,13 @@
+from types import SimpleNamespace
 from typing import List
 
 import pytest
 
 from aphrodite.inputs import zip_enc_dec_prompts
 from aphrodite.inputs.parse import parse_and_batch_prompt
+from aphrodite.inputs.preprocess import InputPreprocessor
+from aphrodite.lora.request import LoRARequest
+from aphrodite.transformers_utils.tokenizer_group import BaseTokenizerGroup
 
 STRING_INPUTS = [
     '',
@@ -77,3 +81,88 @@ def test_zip_enc_dec_prompts(mm_processor_kwargs, expected_mm_kwargs):
         assert zipped['encoder_prompt'] == enc
         assert zipped['decoder_prompt'] == dec
         assert zipped['mm_processor_kwargs'] == exp_kwargs
+
+
+class _RecordingTokenizerGroup(BaseTokenizerGroup):
+    """Tokenizer group fake that records batched encode calls."""
+
+    def __init__(self):
+        self.batch_calls: List[tuple] = []
+
+    @classmethod
+    def from_config(cls, tokenizer_pool_config, **init_kwargs):
+        return cls()
+
+    def ping(self):
+        return True
+
+    def get_max_input_len(self, lora_request=None):
+        return None
+
+    def encode(self, prompt, request_id=None, lora_request=None):
+        return [ord(c) for c in prompt]
+
+    async def encode_async(self, prompt, request_id=None, lora_request=None):
+        return self.encode(prompt)
+
+    def encode_batch(self, prompts, request_ids=None, lora_request=None):
+        lora_int_id = lora_request.lora_int_id if lora_request else 0
+        self.batch_calls.append((list(prompts), lora_int_id))
+        return [[ord(c) for c in prompt] for prompt in prompts]
+
+    def get_lora_tokenizer(self, lora_request=None):
+        return None
+
+    async def get_lora_tokenizer_async(self, lora_request=None):
+        return None
+
+
+def _make_preprocessor():
+    model_config = SimpleNamespace(is_encoder_decoder_model=False)
+    tokenizer_group = _RecordingTokenizerGroup()
+    return InputPreprocessor(model_config, tokenizer_group), tokenizer_group
+
+
+def test_preprocess_many_mixed_prompts():
+    preprocessor, tokenizer_group = _make_preprocessor()
+    prompts = ["ab", {"prompt_token_ids": [1, 2, 3]}, {"prompt": "cd"}]
+
+    outputs = preprocessor.preprocess_many(prompts,
+                                           request_ids=["0", "1", "2"])
+
+    # Both text prompts share one batched tokenizer call; the
+    # pre-tokenized prompt skips tokenization entirely.
+    assert tokenizer_group.batch_calls == [(["ab", "cd"], 0)]
+    assert outputs[0]["prompt_token_ids"] == [ord("a"), ord("b")]
+    assert outputs[1]["prompt_token_ids"] == [1, 2, 3]
+    assert outputs[2]["prompt_token_ids"] == [ord("c"), ord("d")]
+
+
+def test_preprocess_many_buckets_by_lora():
+    preprocessor, tokenizer_group = _make_preprocessor()
+    lora = LoRARequest(lora_name="adapter", lora_int_id=1, lora_path="/a")
+    prompts = ["p0", "p1", "p2", "p3"]
+
+    outputs = preprocessor.preprocess_many(
+        prompts,
+        request_ids=["0", "1", "2", "3"],
+        lora_requests=[None, lora, None, lora])
+
+    # One batched call per distinct adapter, with the results scattered
+    # back into the original prompt order.
+    assert sorted(tokenizer_group.batch_calls) == [(["p0", "p2"], 0),
+                                                   (["p1", "p3"], 1)]
+    assert [output["prompt_token_ids"] for output in outputs
+            ] == [[ord(c) for c in prompt] for prompt in prompts]
+
+
+def test_preprocess_many_rejects_enc_dec_prompt():
+    preprocessor, _ = _make_preprocessor()
+
+    with pytest.raises(ValueError, match="encoder-decoder"):
+        preprocessor.preprocess_many(
+            [{
+                "encoder_prompt": "enc",
+                "decoder_prompt": "dec"
+            }],
+            request_ids=["0"])
@@ -0,0 +1,123 @@
+import asyncio
+from typing import List, Optional
+
+import pytest
+
+from aphrodite.transformers_utils.dyn_batch_tokenizer import (
+    AsyncDynamicBatchTokenizer)
+from aphrodite.transformers_utils.tokenizer_group import BaseTokenizerGroup
+
+
+class _CountingTokenizerGroup(BaseTokenizerGroup):
+    """In-memory tokenizer group that records how it is called."""
+
+    def __init__(self, fail_on: Optional[str] = None):
+        self.fail_on = fail_on
+        self.encode_async_calls = 0
+        self.batch_sizes: List[int] = []
+
+    @classmethod
+    def from_config(cls, tokenizer_pool_config, **init_kwargs):
+        return cls()
+
+    def ping(self) -> bool:
+        return True
+
+    def get_max_input_len(self, lora_request=None):
+        return None
+
+    def _encode(self, prompt: str) -> List[int]:
+        if prompt == self.fail_on:
+            raise ValueError("Input too long.", len(prompt), 0)
+        return [ord(c) for c in prompt]
+
+    def encode(self, prompt, request_id=None, lora_request=None):
+        return self._encode(prompt)
+
+    async def encode_async(self, prompt, request_id=None, lora_request=None):
+        self.encode_async_calls += 1
+        await asyncio.sleep(0.005)
+        return self._encode(prompt)
+
+    async def encode_batch_async(self,
+                                 prompts,
+                                 request_ids=None,
+                                 lora_request=None):
+        self.batch_sizes.append(len(prompts))
+        await asyncio.sleep(0.005)
+        return [self._encode(prompt) for prompt in prompts]
+
+    def get_lora_tokenizer(self, lora_request=None):
+        return None
+
+    async def get_lora_tokenizer_async(self, lora_request=None):
+        return None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_encodes_are_batched():
+    group = _CountingTokenizerGroup()
+    tokenizer = AsyncDynamicBatchTokenizer(group, batch_wait_timeout_s=0.01)
+    prompts = [f"prompt {i}" for i in range(32)]
+
+    results = await asyncio.gather(
+        *(tokenizer.encode(prompt) for prompt in prompts))
+
+    assert results == [[ord(c) for c in prompt] for prompt in prompts]
+    # Concurrent requests must coalesce into fewer tokenizer group calls
+    # than there are prompts, with at least one genuinely batched call.
+    num_calls = group.encode_async_calls + len(group.batch_sizes)
+    assert num_calls < len(prompts)
+    assert max(group.batch_sizes) > 1
+    tokenizer.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_error_scoped_to_offending_prompt():
+    group = _CountingTokenizerGroup(fail_on="bad prompt")
+    tokenizer = AsyncDynamicBatchTokenizer(group, batch_wait_timeout_s=0.01)
+    prompts = ["good 0", "good 1", "bad prompt", "good 2"]
+
+    results = await asyncio.gather(
+        *(tokenizer.encode(prompt) for prompt in prompts),
+        return_exceptions=True)
+
+    assert results[0] == [ord(c) for c in "good 0"]
+    assert results[1] == [ord(c) for c in "good 1"]
+    assert isinstance(results[2], ValueError)
+    assert results[3] == [ord(c) for c in "good 2"]
+    tokenizer.close()
+
+
+def test_encode_survives_event_loop_switch():
+    group = _CountingTokenizerGroup()
+    tokenizer = AsyncDynamicBatchTokenizer(group)
+    expected = [ord(c) for c in "prompt"]
+
+    # Encode on two successive event loops with the first one closed in
+    # between (per-test loops, repeated asyncio.run): the batcher must
+    # drop the state tied to the dead loop instead of cancelling into it.
+    for _ in range(2):
+        loop = asyncio.new_event_loop()
+        try:
+            assert loop.run_until_complete(
+                tokenizer.encode("prompt")) == expected
+        finally:
+            loop.close()
+
+    tokenizer.close()
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_background_task():
+    group = _CountingTokenizerGroup()
+    tokenizer = AsyncDynamicBatchTokenizer(group)
+    await tokenizer.encode("prompt")
+    batch_task = tokenizer._batch_task
+    assert batch_task is not None
+
+    tokenizer.close()
+    await asyncio.sleep(0)
+
+    assert tokenizer._batch_task is None
+    assert batch_task.cancelled()
@@ -28,7 +28,7 @@ class CustomTokenizerGroup(TokenizerGroup):
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("tokenizer_group_type",
-                         [None, "ray", CustomTokenizerGroup])
+                         [None, "ray", "process", CustomTokenizerGroup])
 async def test_tokenizer_group(tokenizer_group_type):
     reference_tokenizer = AutoTokenizer.from_pretrained("gpt2")
     tokenizer_group = get_tokenizer_group(
@@ -51,6 +51,28 @@ async def test_tokenizer_group(tokenizer_group_type):
         assert tokenizer_group._i > 0
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("tokenizer_group_type", [None, "ray", "process"])
+async def test_tokenizer_group_encode_batch(tokenizer_group_type):
+    reference_tokenizer = AutoTokenizer.from_pretrained("gpt2")
+    tokenizer_group = get_tokenizer_group(
+        get_tokenizer_pool_config(tokenizer_group_type),
+        tokenizer_id="gpt2",
+        enable_lora=False,
+        max_num_seqs=1,
+        max_input_length=None,
+    )
+    prompts = [f"prompt {i}" for i in range(8)]
+    request_ids = [str(i) for i in range(8)]
+    expected_results = [
+        reference_tokenizer.encode(prompt) for prompt in prompts
+    ]
+    assert expected_results == tokenizer_group.encode_batch(
+        prompts, request_ids=request_ids, lora_request=None)
+    assert expected_results == await tokenizer_group.encode_batch_async(
+        prompts, request_ids=request_ids, lora_request=None)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize("tokenizer_group_type", ["ray"])
 async def test_tokenizer_group_pool(tokenizer_group_type):